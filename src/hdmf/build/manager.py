@@ -709,6 +709,10 @@ class TypeMap:
         self.__data_types.setdefault(container_cls, (namespace, data_type))
         setattr(container_cls, spec.type_key(), data_type)
         setattr(container_cls, 'namespace', namespace)
+        # refresh the data type cached on the class at definition time, since the
+        # data type attribute was just assigned above (see
+        # AbstractContainer.__gather_fields)
+        container_cls._resolved_data_type = getattr(container_cls, container_cls._data_type_attr, None)
 
     @docval({"name": "container_cls", "type": type,
              "doc": "the AbstractContainer class for which the given ObjectMapper class gets used for"},
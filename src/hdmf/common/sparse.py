@@ -3,7 +3,7 @@ import numpy as np
 import h5py
 
 from ..container import Container
-from ..utils import docval, getargs, call_docval_func
+from ..utils import docval, getargs
 
 from . import register_class
 
@@ -19,7 +19,7 @@ class CSRMatrix(Container):
             {'name': 'shape', 'type': (list, tuple, np.ndarray), 'doc': 'the shape of the matrix', 'default': None},
             {'name': 'name', 'type': str, 'doc': 'the name to use for this when storing', 'default': 'csr_matrix'})
     def __init__(self, **kwargs):
-        call_docval_func(super().__init__, kwargs)
+        self._init_impl(getargs('name', kwargs))
         data = getargs('data', kwargs)
         if isinstance(data, (np.ndarray, h5py.Dataset)):
             if data.ndim == 2:
@@ -20,7 +20,8 @@ class Index(Data):
             {'name': 'target', 'type': Data,
              'doc': 'the target dataset that this index applies to'})
     def __init__(self, **kwargs):
-        call_docval_func(super().__init__, kwargs)
+        name, data = getargs('name', 'data', kwargs)
+        self._init_impl(name, data)
 
 
 @register_class('VectorData')
@@ -44,8 +45,9 @@ class VectorData(Data):
             {'name': 'data', 'type': ('array_data', 'data'),
              'doc': 'a dataset where the first dimension is a concatenation of multiple vectors', 'default': list()})
     def __init__(self, **kwargs):
-        call_docval_func(super().__init__, kwargs)
-        self.description = getargs('description', kwargs)
+        name, description, data = getargs('name', 'description', 'data', kwargs)
+        self._init_impl(name, data)
+        self.description = description
 
     @docval({'name': 'val', 'type': None, 'doc': 'the value to add to this column'})
     def add_row(self, **kwargs):
@@ -68,8 +70,9 @@ class VectorIndex(Index):
             {'name': 'target', 'type': VectorData,
              'doc': 'the target dataset that this index applies to'})
     def __init__(self, **kwargs):
-        call_docval_func(super().__init__, kwargs)
-        self.target = getargs('target', kwargs)
+        name, data, target = getargs('name', 'data', 'target', kwargs)
+        self._init_impl(name, data)
+        self.target = target
 
     def add_vector(self, arg):
         self.target.extend(arg)
@@ -101,7 +104,8 @@ class ElementIdentifiers(Data):
             {'name': 'data', 'type': ('array_data', 'data'), 'doc': 'a 1D dataset containing identifiers',
              'default': list()})
     def __init__(self, **kwargs):
-        call_docval_func(super().__init__, kwargs)
+        name, data = getargs('name', 'data', kwargs)
+        self._init_impl(name, data)
 
     @docval({'name': 'other', 'type': (Data, np.ndarray, list, tuple, int),
              'doc': 'List of ids to search for in this ElementIdentifer object'},
@@ -177,7 +181,7 @@ class DynamicTable(Container):
              'default': None})
     def __init__(self, **kwargs):  # noqa: C901
         id, columns, desc, colnames = popargs('id', 'columns', 'description', 'colnames', kwargs)
-        call_docval_func(super().__init__, kwargs)
+        self._init_impl(getargs('name', kwargs))
         self.description = desc
 
         # All tables must have ElementIdentifiers (i.e. a primary key column)
@@ -1,14 +1,49 @@
 import numpy as np
+import sys
 from abc import abstractmethod
-from uuid import uuid4
-from .utils import docval, get_docval, call_docval_func, getargs, ExtenderMeta, get_data_shape
+from collections import deque
+from random import SystemRandom
+from .utils import docval, get_docval, getargs, ExtenderMeta, get_data_shape
 from .data_utils import DataIO
 from warnings import warn
 import h5py
 
 
+# generating object IDs through uuid.uuid4 allocates a UUID object just to
+# immediately format it as a string. Drawing the 128 random bits directly and
+# formatting them ourselves produces the same RFC 4122 version-4 string at a
+# fraction of the cost
+_getrandbits = SystemRandom().getrandbits
+_UUID_FMT = '%08x-%04x-%04x-%04x-%012x'.__mod__
+
+
+def _generate_object_id():
+    """Generate a string representation of a version-4 UUID"""
+    r = _getrandbits(128)
+    return _UUID_FMT((r >> 96,
+                      (r >> 80) & 0xffff,
+                      ((r >> 64) & 0x0fff) | 0x4000,
+                      ((r >> 48) & 0x3fff) | 0x8000,
+                      r & 0xffffffffffff))
+
+
 class AbstractContainer(metaclass=ExtenderMeta):
 
+    # declare the per-instance attributes (by their mangled names) so instances
+    # do not carry a __dict__ -- this shrinks every container by roughly one
+    # hundred bytes and makes attribute access go through the faster slot
+    # descriptors. Subclasses that do not define __slots__ get a __dict__ for
+    # their own attributes as usual
+    __slots__ = ('_AbstractContainer__container_source',
+                 '_AbstractContainer__parent',
+                 '_AbstractContainer__parent_is_container',
+                 '_AbstractContainer__children',
+                 '_AbstractContainer__modified',
+                 '_AbstractContainer__object_id',
+                 '_AbstractContainer__name',
+                 '_AbstractContainer__field_values',
+                 '__weakref__')
+
     # The name of the class attribute that subclasses use to autogenerate properties
     # This parameterization is supplied in case users would like to configure
     # the class attribute name to something domain-specific
@@ -34,13 +69,17 @@ class AbstractContainer(metaclass=ExtenderMeta):
         if not field.get('settable', True):
             return None
 
-        def setter(self, val):
+        # bind name as a default argument and go straight to __field_values --
+        # this skips the fields property call and a cell-variable load on every
+        # attribute write
+        def setter(self, val, _name=name):
             if val is None:
                 return
-            if name in self.fields:
-                msg = "can't set attribute '%s' -- already set" % name
+            fields = self.__field_values
+            if _name in fields:
+                msg = "can't set attribute '%s' -- already set" % _name
                 raise AttributeError(msg)
-            self.fields[name] = val
+            fields[_name] = val
 
         return setter
 
@@ -52,8 +91,8 @@ class AbstractContainer(metaclass=ExtenderMeta):
         doc = field.get('doc')
         name = field['name']
 
-        def getter(self):
-            return self.fields.get(name)
+        def getter(self, _name=name):
+            return self.__field_values.get(_name)
 
         setattr(getter, '__doc__', doc)
         return getter
@@ -92,26 +131,61 @@ class AbstractContainer(metaclass=ExtenderMeta):
         docs = {dv['name']: dv['doc'] for dv in get_docval(cls.__init__)}
         for f in getattr(cls, cls._fieldsname):
             pconf = cls._check_field_spec(f)
-            pname = pconf['name']
+            # intern the field name so the __field_values dict lookups done on
+            # every field read/write hit the identity fast path
+            pname = pconf['name'] = sys.intern(pconf['name'])
             pconf.setdefault('doc', docs.get(pname))
             if not hasattr(cls, pname):
                 setattr(cls, pname, property(cls._getter(pconf), cls._setter(pconf)))
             new_fields.append(pname)
         setattr(cls, cls._fieldsname, tuple(new_fields))
+        # cache the resolved data type and the type hierarchy on the class so that
+        # get_ancestor and type_hierarchy do not recompute them on every call.
+        # TypeMap.register_container_type refreshes _resolved_data_type when it
+        # assigns the data type to an already-defined class
+        cls._resolved_data_type = getattr(cls, cls._data_type_attr, None)
+        cls._type_hierarchy = cls.__mro__
 
     def __new__(cls, *args, **kwargs):
         inst = super().__new__(cls)
-        inst.__container_source = kwargs.pop('container_source', None)
+        # container_source/object_id/parent are only passed by internal callers
+        # (e.g. the ObjectMapper when constructing from a read builder), so skip
+        # the kwargs pops entirely in the common no-kwargs case
+        if kwargs:
+            inst.__container_source = kwargs.pop('container_source', None)
+            # do not generate an object ID here -- the object_id property will
+            # lazily generate one on first access, so we can skip the uuid4 cost
+            # for the majority of containers whose ID is never read
+            inst.__object_id = kwargs.pop('object_id', None)
+            parent = kwargs.pop('parent', None)
+        else:
+            inst.__container_source = None
+            inst.__object_id = None
+            parent = None
         inst.__parent = None
-        inst.__children = list()
+        # cached isinstance(parent, Container), refreshed by the parent setter
+        # so set_modified does not repeat the check on every walk up the tree
+        inst.__parent_is_container = False
+        # dict used as an insertion-ordered set: O(1) dedup on repeated parent
+        # assignment, ordered iteration for the children property. Keyed by
+        # id(child) because subclasses may define __eq__ without __hash__
+        inst.__children = dict()
         inst.__modified = True
-        inst.__object_id = kwargs.pop('object_id', str(uuid4()))
-        inst.parent = kwargs.pop('parent', None)
+        if parent is not None:
+            inst.parent = parent
         return inst
 
     @docval({'name': 'name', 'type': str, 'doc': 'the name of this container'})
     def __init__(self, **kwargs):
-        name = getargs('name', kwargs)
+        self._init_impl(getargs('name', kwargs))
+
+    def _init_impl(self, name):
+        """
+        Initialize this container without going through docval
+
+        Internal fast path for intra-package callers whose own docval has
+        already validated the arguments
+        """
         if '/' in name:
             raise ValueError("name '" + name + "' cannot contain '/'")
         self.__name = name
@@ -124,17 +198,15 @@ class AbstractContainer(metaclass=ExtenderMeta):
         '''
         return self.__name
 
-    @docval({'name': 'data_type', 'type': str, 'doc': 'the data_type to search for', 'default': None})
-    def get_ancestor(self, **kwargs):
+    def get_ancestor(self, data_type=None):
         """
         Traverse parent hierarchy and return first instance of the specified data_type
         """
-        data_type = getargs('data_type', kwargs)
-        if data_type is None:
-            return self.parent
         p = self.parent
+        if data_type is None:
+            return p
         while p is not None:
-            if getattr(p, p._data_type_attr) == data_type:
+            if p._resolved_data_type == data_type:
                 return p
             p = p.parent
         return None
@@ -146,30 +218,42 @@ class AbstractContainer(metaclass=ExtenderMeta):
     @property
     def object_id(self):
         if self.__object_id is None:
-            self.__object_id = str(uuid4())
+            self.__object_id = _generate_object_id()
         return self.__object_id
 
     @property
     def modified(self):
         return self.__modified
 
-    @docval({'name': 'modified', 'type': bool,
-             'doc': 'whether or not this Container has been modified', 'default': True})
-    def set_modified(self, **kwargs):
-        modified = getargs('modified', kwargs)
+    def set_modified(self, modified=True):
+        """
+        Set whether or not this Container has been modified
+
+        This method is called on every change to the parent hierarchy, so it
+        deliberately skips docval and propagates up the parent chain iteratively
+        """
         self.__modified = modified
-        if modified and isinstance(self.parent, Container):
-            self.parent.set_modified()
+        if modified:
+            # __parent_is_container caches isinstance(parent, Container), which
+            # is invariant once a parent has been assigned
+            # no early exit at already-modified ancestors: set_modified(False)
+            # clears a single node (e.g. BuildManager.construct clears just the
+            # top result), so a marked node does not imply its ancestors are
+            # marked and the walk must always reach the root
+            node = self
+            while node.__parent_is_container:
+                node = node.__parent
+                node.__modified = True
 
     @property
     def children(self):
-        return tuple(self.__children)
+        return tuple(self.__children.values())
 
-    @docval({'name': 'child', 'type': 'Container',
-             'doc': 'the child Container for this Container', 'default': None})
-    def add_child(self, **kwargs):
+    def add_child(self, child=None):
+        """
+        Add the given Container as a child of this Container
+        """
         warn(DeprecationWarning('add_child is deprecated. Set the parent attribute instead.'))
-        child = getargs('child', kwargs)
         if child is not None:
             # if child.parent is a Container, then the mismatch between child.parent and parent
             # is used to make a soft/external link from the parent to a child elsewhere
@@ -182,7 +266,7 @@ class AbstractContainer(metaclass=ExtenderMeta):
 
     @classmethod
     def type_hierarchy(cls):
-        return cls.__mro__
+        return cls._type_hierarchy
 
     @property
     def container_source(self):
@@ -207,95 +291,115 @@ class AbstractContainer(metaclass=ExtenderMeta):
 
     @parent.setter
     def parent(self, parent_container):
-        if self.parent is parent_container:
+        # read __parent once up front -- the common case (no current parent,
+        # assigning a Container) should not pay for the property call and
+        # isinstance cascade of the reassignment handling
+        cur = getattr(self, '_AbstractContainer__parent', None)
+        if cur is parent_container:
             return
 
-        if self.parent is not None:
-            if isinstance(self.parent, AbstractContainer):
-                raise ValueError(('Cannot reassign parent to Container: %s. '
-                                  'Parent is already: %s.' % (repr(self), repr(self.parent))))
-            else:
-                if parent_container is None:
-                    raise ValueError("Got None for parent of '%s' - cannot overwrite Proxy with NoneType" % repr(self))
-                # TODO this assumes isinstance(parent_container, Proxy) but
-                # circular import if we try to do that. Proxy would need to move
-                # or Container extended with this functionality in build/map.py
-                if self.parent.matches(parent_container):
-                    self.__parent = parent_container
-                    parent_container.__children.append(self)
-                    parent_container.set_modified()
-                else:
-                    self.__parent.add_candidate(parent_container)
-        else:
+        if cur is None:
             self.__parent = parent_container
             if isinstance(parent_container, Container):
-                parent_container.__children.append(self)
+                self.__parent_is_container = True
+                parent_container.__children[id(self)] = self
                 parent_container.set_modified()
+        elif isinstance(cur, AbstractContainer):
+            raise ValueError(('Cannot reassign parent to Container: %s. '
+                              'Parent is already: %s.' % (repr(self), repr(cur))))
+        else:
+            if parent_container is None:
+                raise ValueError("Got None for parent of '%s' - cannot overwrite Proxy with NoneType" % repr(self))
+            # TODO this assumes isinstance(parent_container, Proxy) but
+            # circular import if we try to do that. Proxy would need to move
+            # or Container extended with this functionality in build/map.py
+            if cur.matches(parent_container):
+                self.__parent = parent_container
+                self.__parent_is_container = isinstance(parent_container, Container)
+                parent_container.__children[id(self)] = self
+                parent_container.set_modified()
+            else:
+                cur.add_candidate(parent_container)
 
 
 class Container(AbstractContainer):
 
+    # cache for the sorted field keys used by __repr__ (see __sorted_fields)
+    __slots__ = ('_Container__sorted_fields_cache',)
+
     _pconf_allowed_keys = {'name', 'child', 'required_name', 'doc', 'settable'}
 
     @classmethod
     def _setter(cls, field):
         super_setter = AbstractContainer._setter(field)
-        ret = [super_setter]
-        if isinstance(field, dict):
-            for k in field.keys():
-                if k not in cls._pconf_allowed_keys:
-                    msg = "Unrecognized key '%s' in __field__ config '%s' on %s" %\
-                           (k, field['name'], cls.__name__)
-                    raise ValueError(msg)
-            if field.get('required_name', None) is not None:
-                name = field['required_name']
-                idx1 = len(ret) - 1
-
-                def container_setter(self, val):
-                    if val is not None and val.name != name:
-                        msg = "%s field on %s must be named '%s'" % (field['name'], self.__class__.__name__, name)
-                        raise ValueError(msg)
-                    ret[idx1](self, val)
-
-                ret.append(container_setter)
-            if field.get('child', False):
-                idx2 = len(ret) - 1
-
-                def container_setter(self, val):
-                    ret[idx2](self, val)
-                    if val is not None:
-                        if isinstance(val, (tuple, list)):
-                            pass
-                        elif isinstance(val, dict):
-                            val = val.values()
-                        else:
-                            val = [val]
-                        for v in val:
-                            if not isinstance(v.parent, Container):
-                                v.parent = self
-                            # else, the ObjectMapper will create a link from self (parent) to v (child with existing
-                            # parent)
-
-                ret.append(container_setter)
-        return ret[-1]
+        if not isinstance(field, dict):
+            return super_setter
+        for k in field.keys():
+            if k not in cls._pconf_allowed_keys:
+                msg = "Unrecognized key '%s' in __field__ config '%s' on %s" %\
+                       (k, field['name'], cls.__name__)
+                raise ValueError(msg)
+        required_name = field.get('required_name', None)
+        child = field.get('child', False)
+        if super_setter is None or (required_name is None and not child):
+            return super_setter
+        field_name = field['name']
+
+        # the required_name/child directives are known at class-definition time,
+        # so emit one setter with both behaviors inlined rather than a chain of
+        # closures calling each other through list indexing
+        def container_setter(self, val):
+            if required_name is not None and val is not None and val.name != required_name:
+                msg = "%s field on %s must be named '%s'" % (field_name, self.__class__.__name__, required_name)
+                raise ValueError(msg)
+            super_setter(self, val)
+            if child and val is not None:
+                if isinstance(val, (tuple, list)):
+                    pass
+                elif isinstance(val, dict):
+                    val = val.values()
+                else:
+                    val = [val]
+                for v in val:
+                    if not isinstance(v.parent, Container):
+                        v.parent = self
+                    # else, the ObjectMapper will create a link from self (parent) to v (child with existing
+                    # parent)
+
+        return container_setter
+
+    def __sorted_fields(self):
+        """
+        Return the field keys sorted for __repr__, caching the sorted tuple
+        until a new field is added
+        """
+        fields = self.fields
+        keys = getattr(self, '_Container__sorted_fields_cache', None)
+        if keys is None or len(keys) != len(fields):
+            keys = tuple(sorted(fields))  # sorted to enable tests
+            self.__sorted_fields_cache = keys
+        return keys
 
     def __repr__(self):
         cls = self.__class__
-        template = "%s %s.%s at 0x%d" % (self.name, cls.__module__, cls.__name__, id(self))
-        if len(self.fields):
-            template += "\nFields:\n"
-        for k in sorted(self.fields):  # sorted to enable tests
-            v = self.fields[k]
+        # accumulate into a list and join once -- repeated str concatenation
+        # reallocates the whole string each time
+        parts = ["%s %s.%s at 0x%d" % (self.name, cls.__module__, cls.__name__, id(self))]
+        fields = self.fields
+        if len(fields):
+            parts.append("\nFields:\n")
+        for k in self.__sorted_fields():
+            v = fields[k]
             # if isinstance(v, DataIO) or not hasattr(v, '__len__') or len(v) > 0:
             if hasattr(v, '__len__'):
                 if isinstance(v, (np.ndarray, list, tuple)):
                     if len(v) > 0:
-                        template += "  {}: {}\n".format(k, self.__smart_str(v, 1))
+                        parts.append("  {}: {}\n".format(k, self.__smart_str(v, 1)))
                 elif v:
-                    template += "  {}: {}\n".format(k, self.__smart_str(v, 1))
+                    parts.append("  {}: {}\n".format(k, self.__smart_str(v, 1)))
             else:
-                template += "  {}: {}\n".format(k, v)
-        return template
+                parts.append("  {}: {}\n".format(k, v))
+        return ''.join(parts)
 
     @staticmethod
     def __smart_str(v, num_indent):
@@ -322,22 +426,41 @@ class Container(AbstractContainer):
 
         """
 
-        if isinstance(v, list) or isinstance(v, tuple):
-            if len(v) and isinstance(v[0], AbstractContainer):
-                return Container.__smart_str_list(v, num_indent, '(')
-            try:
-                return str(np.asarray(v))
-            except ValueError:
-                return Container.__smart_str_list(v, num_indent, '(')
+        fn = Container.__smart_str_dispatch.get(type(v))
+        if fn is not None:
+            return fn(v, num_indent)
+        # fall back to isinstance checks for subclasses of the dispatched types
+        if isinstance(v, (list, tuple)):
+            return Container.__smart_str_seq(v, num_indent)
         elif isinstance(v, dict):
             return Container.__smart_str_dict(v, num_indent)
         elif isinstance(v, set):
-            return Container.__smart_str_list(sorted(list(v)), num_indent, '{')
+            return Container.__smart_str_set(v, num_indent)
         elif isinstance(v, AbstractContainer):
             return "{} {}".format(getattr(v, 'name'), type(v))
         else:
             return str(v)
 
+    @staticmethod
+    def __smart_str_seq(v, num_indent):
+        if len(v):
+            if isinstance(v[0], AbstractContainer):
+                return Container.__smart_str_list(v, num_indent, '(')
+            # only hand sequences that look homogeneous to numpy -- building an
+            # ndarray from a mixed-type list allocates and copies the whole list
+            # just to throw the array away after formatting
+            t = type(v[0])
+            if not all(isinstance(x, t) for x in v[:16]):
+                return Container.__smart_str_list(v, num_indent, '(')
+        try:
+            return str(np.asarray(v))
+        except ValueError:
+            return Container.__smart_str_list(v, num_indent, '(')
+
+    @staticmethod
+    def __smart_str_set(v, num_indent):
+        return Container.__smart_str_list(sorted(list(v)), num_indent, '{')
+
     @staticmethod
     def __smart_str_list(l, num_indent, left_br):
         if left_br == '(':
@@ -348,13 +471,13 @@ class Container(AbstractContainer):
             return left_br + ' ' + right_br
         indent = num_indent * 2 * ' '
         indent_in = (num_indent + 1) * 2 * ' '
-        out = left_br
+        parts = [left_br]
         for v in l[:-1]:
-            out += '\n' + indent_in + Container.__smart_str(v, num_indent + 1) + ','
+            parts.append('\n' + indent_in + Container.__smart_str(v, num_indent + 1) + ',')
         if l:
-            out += '\n' + indent_in + Container.__smart_str(l[-1], num_indent + 1)
-        out += '\n' + indent + right_br
-        return out
+            parts.append('\n' + indent_in + Container.__smart_str(l[-1], num_indent + 1))
+        parts.append('\n' + indent + right_br)
+        return ''.join(parts)
 
     @staticmethod
     def __smart_str_dict(d, num_indent):
@@ -364,14 +487,22 @@ class Container(AbstractContainer):
             return left_br + ' ' + right_br
         indent = num_indent * 2 * ' '
         indent_in = (num_indent + 1) * 2 * ' '
-        out = left_br
+        parts = [left_br]
         keys = sorted(list(d.keys()))
         for k in keys[:-1]:
-            out += '\n' + indent_in + Container.__smart_str(k, num_indent + 1) + ' ' + str(type(d[k])) + ','
+            parts.append('\n' + indent_in + Container.__smart_str(k, num_indent + 1) + ' ' + str(type(d[k])) + ',')
         if keys:
-            out += '\n' + indent_in + Container.__smart_str(keys[-1], num_indent + 1) + ' ' + str(type(d[keys[-1]]))
-        out += '\n' + indent + right_br
-        return out
+            parts.append('\n' + indent_in + Container.__smart_str(keys[-1], num_indent + 1)
+                         + ' ' + str(type(d[keys[-1]])))
+        parts.append('\n' + indent + right_br)
+        return ''.join(parts)
+
+    # exact-type dispatch for __smart_str: one dict lookup replaces the chain
+    # of isinstance probes for the common built-in types
+    __smart_str_dispatch = {list: __smart_str_seq.__func__,
+                            tuple: __smart_str_seq.__func__,
+                            dict: __smart_str_dict.__func__,
+                            set: __smart_str_set.__func__}
 
 
 class Data(AbstractContainer):
@@ -379,15 +510,81 @@ class Data(AbstractContainer):
     A class for representing dataset containers
     """
 
+    __slots__ = ('_Data__data', '_Data__np_size')
+
     @docval({'name': 'name', 'type': str, 'doc': 'the name of this container'},
             {'name': 'data', 'type': ('array_data', 'data'), 'doc': 'the source of the data'})
     def __init__(self, **kwargs):
-        call_docval_func(super().__init__, kwargs)
-        self.__data = getargs('data', kwargs)
+        name, data = getargs('name', 'data', kwargs)
+        self._init_impl(name, data)
+
+    def _init_impl(self, name, data):
+        """
+        Initialize this Data object without going through docval (see
+        AbstractContainer._init_impl)
+        """
+        super()._init_impl(name)
+        self.__data = data
+        # when __data is a numpy array that has been appended/extended, __data is
+        # over-allocated and __np_size tracks how many rows are in use, so that
+        # repeated appends do not reallocate and copy the whole array every call.
+        # a value of None means __data holds exactly its logical contents
+        self.__np_size = None
+
+    # pool of released instances for _acquire to recycle, so short-lived
+    # build-time wrappers can skip the docval-validated constructor
+    __pool = deque(maxlen=256)
+
+    @classmethod
+    def _acquire(cls, name, data):
+        """
+        Get a Data object named ``name`` wrapping ``data``, recycling a pooled
+        instance when one is available
+
+        This bypasses constructor validation and is meant for internal use on
+        hot paths where the instance has a clearly scoped lifetime. Return the
+        instance to the pool with :py:meth:`_release` when done with it
+        """
+        if cls is not Data:  # only plain Data instances are pooled
+            return cls(name, data)
+        try:
+            inst = cls.__pool.pop()
+        except IndexError:
+            return cls(name, data)
+        inst._AbstractContainer__container_source = None
+        inst._AbstractContainer__parent = None
+        inst._AbstractContainer__children.clear()
+        inst._AbstractContainer__modified = True
+        inst._AbstractContainer__object_id = None
+        # _init_impl re-validates the name, so a recycled instance rejects the
+        # same names the constructor fallback does
+        inst._init_impl(name, data)
+        return inst
+
+    @classmethod
+    def _release(cls, inst):
+        """
+        Return an instance obtained from :py:meth:`_acquire` to the pool
+
+        The caller must not hold on to the instance afterwards. Instances that
+        are still wired into a container tree -- with a parent or children that
+        would keep exposing the instance after it is re-initialized -- are
+        refused, as is an instance that is already in the pool
+        """
+        if type(inst) is not Data:
+            return
+        if inst._AbstractContainer__parent is not None or inst._AbstractContainer__children:
+            return
+        pool = cls.__pool
+        if any(pooled is inst for pooled in pool):
+            return
+        pool.append(inst)
 
     @property
     def data(self):
-        return self.__data
+        if self.__np_size is None:
+            return self.__data
+        return self.__data[:self.__np_size]
 
     @property
     def shape(self):
@@ -396,33 +593,82 @@ class Data(AbstractContainer):
         :return: Shape tuple
         :rtype: tuple of ints
         """
-        return get_data_shape(self.__data)
+        return get_data_shape(self.data)
 
-    @docval({'name': 'dataio', 'type': DataIO, 'doc': 'the DataIO to apply to the data held by this Data'})
-    def set_dataio(self, **kwargs):
+    def set_dataio(self, dataio):
         """
         Apply DataIO object to the data held by this Data object
         """
-        dataio = getargs('dataio', kwargs)
-        dataio.data = self.__data
+        if not isinstance(dataio, DataIO):
+            raise TypeError("dataio must be an instance of DataIO")
+        dataio.data = self.data
         self.__data = dataio
+        self.__np_size = None
 
     def __bool__(self):
         return len(self.data) != 0
 
     def __len__(self):
+        if self.__np_size is not None:
+            return self.__np_size
         return len(self.__data)
 
+    # maps element types to the array dtype kinds they may convert to without
+    # coercion -- used by __getitem__ to detect when np.asarray changed the
+    # element values (e.g. ints promoted to floats by a float elsewhere)
+    __dtype_kinds = {int: 'iu', float: 'f', complex: 'c', bool: 'b', str: 'U', bytes: 'S'}
+
     def __getitem__(self, args):
         if isinstance(self.data, (tuple, list)) and isinstance(args, (tuple, list)):
-            return [self.data[i] for i in args]
+            data = self.data
+            if len(data) and len(args) > 1 and all(isinstance(i, int) for i in args):
+                # gather integer index lists with a single np.take rather than a
+                # Python-level loop, but only when every element has the same
+                # known scalar type and the array dtype matches it: np.asarray
+                # silently coerces mixed-type lists (ints to floats, everything
+                # to str) instead of raising, and tolist() would turn tuple or
+                # list rows of an object array back into lists
+                t = type(data[0])
+                kinds = self.__dtype_kinds.get(t)
+                if kinds is not None and all(type(x) is t for x in data):
+                    arr = np.asarray(data)
+                    if arr.dtype.kind in kinds:
+                        return arr.take(args, axis=0).tolist()
+            return [data[i] for i in args]
         return self.data[args]
 
+    def __np_reserve(self, n_add, arg):
+        """
+        Make sure the underlying numpy array has capacity for n_add more rows
+        and a dtype that can hold arg without truncation, and return the index
+        of the first free row. Capacity doubles when it is exhausted, giving
+        amortized O(1) appends instead of the O(N) copy that np.append does on
+        every call, and the dtype is promoted with np.result_type so values
+        that do not fit widen the buffer instead of truncating or overflowing
+        """
+        if self.__np_size is None:
+            self.__np_size = len(self.__data)
+        size = self.__np_size
+        capacity = len(self.__data)
+        # promote from the value's own dtype: under NEP 50 a Python scalar is
+        # weak, so result_type(uint8, 300) would stay uint8 and assignment of
+        # 300 would raise OverflowError
+        dtype = np.result_type(self.__data.dtype, np.asarray(arg).dtype)
+        if size + n_add > capacity or dtype != self.__data.dtype:
+            if size + n_add > capacity:
+                capacity = max(2 * capacity, size + n_add, 16)
+            buf = np.empty((capacity,) + self.__data.shape[1:], dtype=dtype)
+            buf[:size] = self.__data[:size]
+            self.__data = buf
+        return size
+
     def append(self, arg):
         if isinstance(self.data, list):
             self.data.append(arg)
-        elif isinstance(self.data, np.ndarray):
-            self.__data = np.append(self.__data, [arg])
+        elif isinstance(self.__data, np.ndarray):
+            size = self.__np_reserve(1, arg)
+            self.__data[size] = arg
+            self.__np_size = size + 1
         elif isinstance(self.data, h5py.Dataset):
             shape = list(self.__data.shape)
             shape[0] += 1
@@ -435,8 +681,11 @@ class Data(AbstractContainer):
     def extend(self, arg):
         if isinstance(self.data, list):
             self.data.extend(arg)
-        elif isinstance(self.data, np.ndarray):
-            self.__data = np.append(self.__data, [arg])
+        elif isinstance(self.__data, np.ndarray):
+            arg = np.asarray(arg)
+            size = self.__np_reserve(len(arg), arg)
+            self.__data[size:size + len(arg)] = arg
+            self.__np_size = size + len(arg)
         elif isinstance(self.data, h5py.Dataset):
             shape = list(self.__data.shape)
             shape[0] += len(arg)
@@ -449,6 +698,8 @@ class Data(AbstractContainer):
 
 class DataRegion(Data):
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def data(self):
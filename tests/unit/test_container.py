@@ -77,6 +77,20 @@ class TestContainer(TestCase):
         child_obj.set_modified()
         self.assertTrue(child_obj.parent.modified)
 
+    def test_set_modified_after_partial_clear(self):
+        """Test that set modified re-marks an ancestor whose flag was cleared while
+        a node in between is still marked
+        """
+        root_obj = Container('root')
+        mid_obj = Container('mid')
+        leaf_obj = Container('leaf')
+        mid_obj.parent = root_obj
+        leaf_obj.parent = mid_obj
+        root_obj.set_modified(False)
+        self.assertTrue(mid_obj.modified)
+        leaf_obj.set_modified()
+        self.assertTrue(root_obj.modified)
+
     def test_add_child(self):
         """Test that add child creates deprecation warning and also properly sets child's parent and modified
         """
@@ -146,3 +160,115 @@ class TestData(TestCase):
         """
         data_obj = Data('my_data', [[0, 1, 2, 3, 4], [0, 1, 2, 3, 4]])
         self.assertTupleEqual(data_obj.shape, (2, 5))
+
+    def test_acquire_release(self):
+        """
+        Test that a released Data object is recycled by _acquire and fully reset
+        """
+        data_obj = Data('my_data', [1, 2, 3])
+        Data._release(data_obj)
+        recycled = Data._acquire('other_data', [4, 5])
+        self.assertIs(recycled, data_obj)
+        self.assertEqual(recycled.name, 'other_data')
+        self.assertEqual(recycled.data, [4, 5])
+        self.assertIsNone(recycled.parent)
+
+    def test_acquire_bad_name(self):
+        """
+        Test that _acquire rejects a name with a slash on both the new and recycled paths
+        """
+        with self.assertRaises(ValueError):
+            Data._acquire('bad/name', [1, 2, 3])
+        Data._release(Data('my_data', [1, 2, 3]))
+        with self.assertRaises(ValueError):
+            Data._acquire('bad/name', [1, 2, 3])
+
+    def test_acquire_empty_pool(self):
+        """
+        Test that _acquire constructs a new Data object when the pool is empty
+        """
+        data_obj = Data._acquire('my_data', [1, 2, 3])
+        self.assertEqual(data_obj.name, 'my_data')
+        self.assertEqual(data_obj.data, [1, 2, 3])
+
+    def test_release_with_parent(self):
+        """
+        Test that _release refuses a Data object that is still a child of a Container
+        """
+        parent_obj = Container('obj1')
+        data_obj = Data('my_data', [1, 2, 3])
+        data_obj.parent = parent_obj
+        Data._release(data_obj)
+        recycled = Data._acquire('other_data', [4, 5])
+        self.assertIsNot(recycled, data_obj)
+        self.assertIs(parent_obj.children[0], data_obj)
+        self.assertEqual(data_obj.name, 'my_data')
+
+    def test_double_release(self):
+        """
+        Test that releasing the same Data object twice does not pool it twice
+        """
+        data_obj = Data('my_data', [1, 2, 3])
+        Data._release(data_obj)
+        Data._release(data_obj)
+        first = Data._acquire('data1', [1])
+        second = Data._acquire('data2', [2])
+        self.assertIsNot(first, second)
+
+    def test_getitem_list_indices(self):
+        """
+        Test that indexing list data with a list of indices preserves rows and element types
+        """
+        data_obj = Data('my_data', [10, 20, 30, 40])
+        self.assertEqual(data_obj[[0, 2]], [10, 30])
+        self.assertEqual(data_obj[[0, -1]], [10, 40])
+        nested_obj = Data('my_data', [[0, 1, 2], [3, 4, 5], [6, 7, 8]])
+        self.assertEqual(nested_obj[[0, 2]], [[0, 1, 2], [6, 7, 8]])
+        mixed_obj = Data('my_data', [1, 'a', 2.5])
+        self.assertEqual(mixed_obj[[0, 2]], [1, 2.5])
+        tuple_obj = Data('my_data', [(1, 2), (3, 4), (5, 6)])
+        self.assertEqual(tuple_obj[[0, 2]], [(1, 2), (5, 6)])
+        late_mixed = ['a'] * 20
+        late_mixed[17] = 5
+        late_mixed_obj = Data('my_data', late_mixed)
+        self.assertEqual(late_mixed_obj[[0, 17]], ['a', 5])
+
+    def test_append_nparray(self):
+        """
+        Test that repeated appends to an np.array-backed Data return the correct data
+        """
+        data_obj = Data('my_data', np.array([1, 2, 3]))
+        for i in range(4, 50):
+            data_obj.append(i)
+        self.assertEqual(len(data_obj), 49)
+        np.testing.assert_array_equal(data_obj.data, np.arange(1, 50))
+
+    def test_extend_nparray(self):
+        """
+        Test that extend with a multi-element argument works for np.array
+        """
+        data_obj = Data('my_data', np.array([1, 2, 3]))
+        data_obj.extend([4, 5])
+        data_obj.extend(np.array([6, 7]))
+        self.assertEqual(len(data_obj), 7)
+        self.assertTupleEqual(data_obj.shape, (7,))
+        np.testing.assert_array_equal(data_obj.data, np.arange(1, 8))
+
+    def test_append_extend_nparray_promote_dtype(self):
+        """
+        Test that append and extend promote the dtype of an np.array instead of truncating
+        """
+        data_obj = Data('my_data', np.array([1, 2, 3]))
+        data_obj.append(4.5)
+        data_obj.extend([5.5, 6.5])
+        np.testing.assert_array_equal(data_obj.data, np.array([1., 2., 3., 4.5, 5.5, 6.5]))
+        self.assertEqual(data_obj.data.dtype.kind, 'f')
+
+    def test_append_small_dtype_promote(self):
+        """
+        Test that append promotes a small integer dtype when the value does not fit
+        """
+        data_obj = Data('my_data', np.array([1, 2, 3], dtype=np.uint8))
+        data_obj.append(300)
+        data_obj.append(-1)
+        np.testing.assert_array_equal(data_obj.data, np.array([1, 2, 3, 300, -1]))